@@ -2,7 +2,7 @@
 import logging
 import tkinter as tk
 from app.calibrator_app import CalibratorApp
-from app.utils import load_config, setup_loggers
+from app.utils import configure_loggers, load_config, setup_loggers, shutdown_loggers
 
 def main():
     """Punto de entrada principal de la aplicación."""
@@ -11,8 +11,10 @@ def main():
     logging.info("Cargando configuración desde 'config.yaml'...")
     config = load_config()
     if not config:
-        logging.critical("La carga de q falló. La aplicación no puede continuar.")
+        logging.critical("La carga de la configuración falló. La aplicación no puede continuar.")
+        shutdown_loggers()
         return
+    configure_loggers(config.get('logging'))
     
     try:
         root = tk.Tk()
@@ -25,7 +27,9 @@ def main():
             app.run()
             
     except Exception as e:
-        logging.critical(f"Ha ocurrido un error fatal: {e}", exc_info=True)
+        logging.critical("Ha ocurrido un error fatal: %s", e, exc_info=True)
+    finally:
+        shutdown_loggers()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -168,14 +168,15 @@ class CalibratorApp:
                     
                 except Exception as e:
                     # Si falla el parseo de una trama que *parecía* telemetría, es un error
-                    logging.error(f"Error al parsear la trama de telemetría '{line}': {e}")
+                    logging.error("Error al parsear la trama de telemetría '%s': %s", line, e,
+                                  extra={'stage': 'telemetry'})
             
             elif line:
                 # --- Es un Mensaje de Evento/Log ---
                 # Si no es telemetría, es un mensaje de log/evento del ESP32
                 # Lo registramos en el log de eventos principal (calibrator.log)
-                # Usamos el logger raíz configurado en utils.py
-                logging.info(f"[ESP32-Cliente]: {line}")
+                # Usamos el logger raíz configurado en utils.py (escritura en segundo plano)
+                logging.info("[ESP32-Cliente]: %s", line, extra={'stage': 'esp32'})
 
             
     def _log_sensor_data(self):
@@ -9,6 +9,7 @@ Created on Fri Sep  5 00:25:51 2025
 import cv2
 import pytesseract
 import logging
+import time
 from collections import Counter
 
 class OCRManager:
@@ -20,12 +21,23 @@ class OCRManager:
         self.readings_buffer = []
         self.stable_reading = "---"
 
+        # El log DEBUG por frame se muestrea para no saturar la cola de logging
+        log_cfg = config.get('logging') or {}
+        try:
+            self.debug_sample_every = max(1, int(log_cfg.get('debug_sample_every', 25)))
+        except (TypeError, ValueError):
+            logging.warning("Valor inválido para logging.debug_sample_every; se usa 25.")
+            self.debug_sample_every = 25
+        self.frame_count = 0
+
     def _initialize_tesseract(self):
         try:
             pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
-            logging.info(f"Tesseract version: {pytesseract.get_tesseract_version()}")
+            logging.info("Tesseract version: %s", pytesseract.get_tesseract_version(),
+                         extra={'stage': 'ocr_init'})
         except Exception as e:
-            logging.error(f"No se pudo encontrar Tesseract en '{self.tesseract_path}'. Error: {e}")
+            logging.error("No se pudo encontrar Tesseract en '%s'. Error: %s", self.tesseract_path, e,
+                          extra={'stage': 'ocr_init'})
 
     def process_frame(self, frame, roi_coords, threshold_value):
         """Realiza el OCR sobre una ROI del frame y actualiza el búfer."""
@@ -38,9 +50,14 @@ class OCRManager:
         thr_roi = cv2.threshold(gray_roi, threshold_value, 255, cv2.THRESH_BINARY_INV)[1]
 
         config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789'
+        start = time.perf_counter()
         raw_text = pytesseract.image_to_string(thr_roi, config=config).strip()
-        
-        logging.debug(f"Tesseract leyó: '{raw_text}'")
+
+        self.frame_count += 1
+        if self.frame_count % self.debug_sample_every == 0 and logging.getLogger().isEnabledFor(logging.DEBUG):
+            elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+            logging.debug("Tesseract leyó: '%s' (frame %d)", raw_text, self.frame_count,
+                          extra={'stage': 'ocr', 'ms': elapsed_ms})
         validated_text = self._validate_reading(raw_text)
 
         if validated_text:
@@ -78,6 +95,7 @@ class OCRManager:
 
         if confidence >= buffer_conf['confidence_threshold'] and self.stable_reading != candidate:
             self.stable_reading = candidate
-            logging.info(f"NUEVO VALOR ESTABLE: '{candidate}' (confianza: {confidence:.0%})")
+            logging.info("NUEVO VALOR ESTABLE: '%s' (confianza: %.0f%%)", candidate, confidence * 100,
+                         extra={'stage': 'ocr_stable'})
             return True
         return False
\ No newline at end of file
@@ -17,15 +17,15 @@ class SerialManager:
 
         current_time = time.time()
         if current_time - self.last_reconnect_attempt > 10:
-            logging.info(f"Intentando conectar al puerto serial {self.port}...")
+            logging.info("Intentando conectar al puerto serial %s...", self.port, extra={'stage': 'serial'})
             self.last_reconnect_attempt = current_time
             try:
                 self.ser = serial.Serial(self.port, self.baud_rate, timeout=1)
                 time.sleep(2)
-                logging.info(f"¡Puerto serial {self.port} conectado exitosamente!")
+                logging.info("¡Puerto serial %s conectado exitosamente!", self.port, extra={'stage': 'serial'})
                 return True
             except serial.SerialException:
-                logging.warning(f"Conexión a {self.port} fallida. Se reintentará...")
+                logging.warning("Conexión a %s fallida. Se reintentará...", self.port, extra={'stage': 'serial'})
                 self.ser = None
         return False
 
@@ -35,7 +35,6 @@ class SerialManager:
             return None
         try:
             return self.ser.readline().decode('utf-8', errors='ignore').strip()
-            logging.info(f"Recepción Serial: {self.ser.readline().decode('utf-8', errors='ignore').strip()}")
         except serial.SerialException:
             self._handle_disconnect()
             return None
@@ -43,18 +42,18 @@ class SerialManager:
     def send_command(self, command):
         """Envía un comando al ESP32."""
         if not (self.ser and self.ser.is_open):
-            logging.warning(f"Envío de '{command}' fallido: Puerto no disponible.")
+            logging.warning("Envío de '%s' fallido: Puerto no disponible.", command, extra={'stage': 'command'})
             return
         try:
             self.ser.write(f"{command}\n".encode('utf-8'))
-            logging.info(f"Comando enviado al ESP32: {command}")
+            logging.info("Comando enviado al ESP32: %s", command, extra={'stage': 'command'})
         except serial.SerialException:
             self._handle_disconnect()
 
     def _handle_disconnect(self):
         """Maneja una desconexión inesperada."""
         if self.ser and self.ser.is_open:
-            logging.warning("CONEXIÓN SERIAL PERDIDA")
+            logging.warning("CONEXIÓN SERIAL PERDIDA", extra={'stage': 'serial'})
             self.ser.close()
         self.ser = None
         self.last_reconnect_attempt = time.time()
@@ -63,4 +62,4 @@ class SerialManager:
         """Cierra la conexión serial de forma segura."""
         if self.ser and self.ser.is_open:
             self.ser.close()
-            logging.info("Puerto serial cerrado.")
\ No newline at end of file
+            logging.info("Puerto serial cerrado.", extra={'stage': 'serial'})
\ No newline at end of file
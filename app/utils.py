@@ -1,7 +1,11 @@
 # app/utils.py
+import atexit
+import copy
 import logging
 import os
+import queue
 import yaml
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 
 PCB2_STATE_MAP = {
@@ -13,37 +17,129 @@ PCB2_STATE_MAP = {
     5: "PANIC_MODE"
 }
 
-def setup_loggers():
-    """Configura el logger de la aplicación y el logger de datos CSV."""
-    # (El código de la función setup_loggers() va aquí, sin cambios)
+# Campos estructurados que se agregan al final de cada línea si están presentes
+# en el registro (se pasan con extra={'stage': ..., 'ms': ...}).
+STRUCTURED_FIELDS = ('stage', 'bench', 'ms')
+
+# Listeners activos; se detienen en shutdown_loggers() para vaciar la cola.
+_log_listeners = []
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formatter que agrega los campos estructurados como 'clave=valor'."""
+
+    def formatMessage(self, record):
+        # Se agregan antes del traceback para que queden en la primera línea
+        message = super().formatMessage(record)
+        fields = [f"{name}={getattr(record, name)}"
+                  for name in STRUCTURED_FIELDS
+                  if getattr(record, name, None) is not None]
+        if fields:
+            message = f"{message} | {' '.join(fields)}"
+        return message
+
+
+class _ContextFilter(logging.Filter):
+    """Inyecta el identificador del banco en todos los registros."""
+
+    def __init__(self, bench='-'):
+        super().__init__()
+        self.bench = bench
+
+    def filter(self, record):
+        if getattr(record, 'bench', None) is None:
+            record.bench = self.bench
+        return True
+
+
+_context_filter = _ContextFilter()
+
+
+class _CopyingQueueHandler(QueueHandler):
+    """
+    QueueHandler que encola una copia del registro con el mensaje ya resuelto.
+    A diferencia del estándar conserva exc_info, así el traceback lo formatea
+    el listener y los campos estructurados quedan en la primera línea.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+def _start_listener(logger, handlers, context_filter=None):
+    """Reemplaza los handlers del logger por una cola atendida en segundo plano."""
+    log_queue = queue.SimpleQueue()  # Sin límite: put() nunca bloquea
+    queue_handler = _CopyingQueueHandler(log_queue)
+    if context_filter is not None:
+        queue_handler.addFilter(context_filter)
+
+    if logger.hasHandlers():
+        logger.handlers.clear()
+    logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _log_listeners.append(listener)
+
+
+def setup_loggers(log_config=None):
+    """
+    Configura el logger de la aplicación y el logger de datos CSV.
+    Las escrituras a disco y consola se hacen en hilos de fondo (QueueListener),
+    de modo que loguear desde el bucle de Tk nunca bloquea por E/S.
+    """
+    shutdown_loggers()
+
     # --- Configuración del Logger Principal (calibrator.log) ---
     log_format = '%(asctime)s - %(levelname)s - %(message)s'
-    logging.basicConfig(level=logging.INFO,
-                        format=log_format,
-                        filename='calibrator.log',
-                        filemode='a')
+    formatter = StructuredFormatter(log_format)
+    file_handler = logging.FileHandler('calibrator.log', mode='a', encoding='utf-8')
+    file_handler.setFormatter(formatter)
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter(log_format))
-    logging.getLogger().addHandler(console_handler)
+    console_handler.setFormatter(formatter)
+
+    _start_listener(logging.getLogger(), [file_handler, console_handler], _context_filter)
+    configure_loggers(log_config)
 
     # --- Configuración del Logger de Datos (mediciones.csv) ---
     data_filename = 'data_logger.csv'
     file_exists = os.path.exists(data_filename)
     data_logger = logging.getLogger('data_logger')
     data_logger.setLevel(logging.INFO)
-    
-    if data_logger.hasHandlers():
-        data_logger.handlers.clear()
-        
+    data_logger.propagate = False  # Las filas del CSV no van a calibrator.log
+
     data_handler = logging.FileHandler(data_filename, mode='a', encoding='utf-8')
     data_handler.setFormatter(logging.Formatter('%(message)s'))
-    data_logger.addHandler(data_handler)
-    
+    _start_listener(data_logger, [data_handler])
+
     if not file_exists:
         data_logger.info("Fecha,Hora,GM-70[ppm],MH-Z19C[ppm],Temperatura[°c],Humedad[%],Presion[hPa]")
 
     return data_logger
 
+def configure_loggers(log_config=None):
+    """Aplica el nivel y el identificador de banco de la sección 'logging' del config."""
+    log_config = log_config or {}
+    level = getattr(logging, str(log_config.get('level', 'INFO')).upper(), logging.INFO)
+    if not isinstance(level, int):
+        level = logging.INFO
+    logging.getLogger().setLevel(level)
+    _context_filter.bench = log_config.get('bench', '-')
+
+def shutdown_loggers():
+    """Detiene los listeners de logging, escribiendo los mensajes pendientes."""
+    while _log_listeners:
+        listener = _log_listeners.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+atexit.register(shutdown_loggers)
+
 def load_config(config_path='config.yaml'):
     """Lee y carga la configuración desde un archivo YAML."""
     # (El código de la función load_config() va aquí, sin cambios)
@@ -51,9 +147,9 @@ def load_config(config_path='config.yaml'):
         with open(config_path, 'r', encoding='utf-8') as file:
             return yaml.safe_load(file)
     except FileNotFoundError:
-        logging.error(f"No se encontró el archivo de configuración: {config_path}")
+        logging.error("No se encontró el archivo de configuración: %s", config_path)
         return None
     except Exception as e:
-        logging.error(f"Error al leer o parsear el archivo de configuración: {e}")
+        logging.error("Error al leer o parsear el archivo de configuración: %s", e)
         return None
     
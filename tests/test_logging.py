@@ -0,0 +1,115 @@
+# tests/test_logging.py
+import io
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from app import utils
+from app.ocr_manager import OCRManager
+
+
+class LoggingTestCase(unittest.TestCase):
+    """Ejecuta setup_loggers() dentro de un directorio temporal."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        # Silenciamos la consola para no ensuciar la salida de los tests
+        patcher = mock.patch('sys.stderr', new_callable=io.StringIO)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        utils.shutdown_loggers()
+        for name in (None, 'data_logger'):
+            logging.getLogger(name).handlers.clear()
+        logging.getLogger().setLevel(logging.WARNING)
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def read_log(self, filename='calibrator.log'):
+        with open(filename, encoding='utf-8') as file:
+            return file.read().splitlines()
+
+
+class TestSetupLoggers(LoggingTestCase):
+
+    def test_messages_are_written_after_shutdown(self):
+        data_logger = utils.setup_loggers({'level': 'DEBUG', 'bench': 'b1'})
+        logging.debug("lectura %s", '400', extra={'stage': 'ocr', 'ms': 1.5})
+        data_logger.info("01/01/2025,00:00:00,400,410,20.0,50.0,1013")
+        utils.shutdown_loggers()
+
+        log_lines = self.read_log()
+        self.assertEqual(len(log_lines), 1)
+        self.assertTrue(log_lines[0].endswith("DEBUG - lectura 400 | stage=ocr bench=b1 ms=1.5"))
+
+        csv_lines = self.read_log('data_logger.csv')
+        self.assertEqual(csv_lines[0].split(',')[0], "Fecha")
+        self.assertEqual(csv_lines[1], "01/01/2025,00:00:00,400,410,20.0,50.0,1013")
+
+    def test_configure_loggers_applies_level_and_bench(self):
+        utils.setup_loggers()
+        logging.debug("oculto")
+        utils.configure_loggers({'level': 'WARNING', 'bench': 'b2'})
+        logging.info("oculto")
+        logging.warning("visible")
+        utils.shutdown_loggers()
+
+        self.assertEqual(len(self.read_log()), 1)
+        self.assertIn("visible | bench=b2", self.read_log()[0])
+
+    def test_structured_fields_precede_traceback(self):
+        utils.setup_loggers({'bench': 'b1'})
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            logging.error("fallo", exc_info=True, extra={'stage': 'x'})
+        utils.shutdown_loggers()
+
+        log_lines = self.read_log()
+        self.assertTrue(log_lines[0].endswith("fallo | stage=x bench=b1"))
+        self.assertEqual(log_lines[-1], "ZeroDivisionError: division by zero")
+
+    def test_setup_twice_replaces_listeners(self):
+        utils.setup_loggers()
+        utils.setup_loggers()
+        self.assertEqual(len(utils._log_listeners), 2)
+
+
+class TestOCRDebugSampling(LoggingTestCase):
+
+    def make_manager(self, log_cfg):
+        config = {
+            'tesseract': {'command_path': 'tesseract'},
+            'detection': {'validation_buffer': {'size': 10, 'confidence_threshold': 0.7}},
+            'logging': log_cfg,
+        }
+        with mock.patch('pytesseract.get_tesseract_version', return_value='5.0'):
+            return OCRManager(config)
+
+    def test_debug_line_is_sampled(self):
+        utils.setup_loggers({'level': 'DEBUG'})
+        manager = self.make_manager({'debug_sample_every': '3'})
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        with mock.patch('pytesseract.image_to_string', return_value='400'):
+            for _ in range(7):
+                manager.process_frame(frame, (0, 0, 50, 50), 150)
+        utils.shutdown_loggers()
+
+        debug_lines = [line for line in self.read_log() if "Tesseract leyó" in line]
+        self.assertEqual(len(debug_lines), 2)
+        self.assertIn("(frame 3) | stage=ocr", debug_lines[0])
+        self.assertIn("(frame 6) | stage=ocr", debug_lines[1])
+
+    def test_empty_logging_section_uses_default(self):
+        self.assertEqual(self.make_manager(None).debug_sample_every, 25)
+
+
+if __name__ == '__main__':
+    unittest.main()